@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from typing import ClassVar
+
 
 class NoValueT:
     __slots__ = ()
 
-    instance: NoValueT
+    instance: ClassVar[NoValueT]
 
     def __new__(cls) -> NoValueT:
         if not hasattr(cls, "instance"):
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from asyncio import Future
+from typing import TypeVar, Union
+
+from ._sentinel import NoValue, NoValueT
+
+_T = TypeVar("_T")
+
+
+class SharedFuture(Future[Union[_T, NoValueT]]):
+    """A future that is awaited by many tasks at once.
+
+    Cancelling a task which is awaiting a future also cancels the future, which would wake every
+    other task awaiting it with a CancelledError. Instead, cancelling a SharedFuture resolves it
+    with NoValue: the cancelled task still raises CancelledError, while the other waiters see
+    NoValue and should wait again on a fresh future.
+
+    The trade-off is that cancelling any one waiter wakes all the others, which each register
+    again on the new future. With N tasks waiting on the same future under timeouts (e.g.
+    asyncio.wait_for), every timeout costs O(N) wakeups rather than one.
+    """
+
+    def cancel(self, msg: object = None) -> bool:
+        if not self.done():
+            self.set_result(NoValue)
+        return False
+
+
+__all__ = ("SharedFuture",)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from typing import cast, SupportsInt
+from contextlib import contextmanager
+from typing import Callable, Iterator, SupportsInt
 
 from .switch import Switch
 
 
+def _unchecked(value: int) -> int:
+    return value
+
+
 class EventfulCounter(SupportsInt):
     """EventfulCounter
 
@@ -43,6 +48,18 @@ class EventfulCounter(SupportsInt):
             Defaults to False.
     """
 
+    __slots__ = (
+        "_counter",
+        "_max_value",
+        "_min_value",
+        "_clamp_to_bounds",
+        "_min_ev",
+        "_max_ev",
+        "_set",
+        "_batch_depth",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         initial_value: int = 0,
@@ -51,9 +68,9 @@ class EventfulCounter(SupportsInt):
         clamp_to_bounds: bool = False,
     ) -> None:
         self._counter: int = initial_value
-        self._max_value = max_value
-        self._min_value = min_value
-        self._clamp_to_bounds = clamp_to_bounds
+        self._max_value: int | None = max_value
+        self._min_value: int | None = min_value
+        self._clamp_to_bounds: bool = clamp_to_bounds
 
         if max_value is not None and min_value is not None and max_value < min_value:
             raise ValueError("max_value must be greater than min_value")
@@ -71,17 +88,19 @@ class EventfulCounter(SupportsInt):
         if min_value is not None and max_value is not None and min_value == max_value:
             raise ValueError("min_value and max_value cannot be equal")
 
-        self._min_ev = Switch()
-        self._max_ev = Switch()
+        self._min_ev: Switch = Switch()
+        self._max_ev: Switch = Switch()
+        self._batch_depth: int = 0
+        self._set: Callable[[int], int] = self._build_set()
         self.set(initial_value)
 
     def inc(self, by: SupportsInt = 1) -> None:
         """Increment the counter."""
-        self.set(self._counter + int(by))
+        self._counter = self._set(self._counter + int(by))
 
     def dec(self, by: SupportsInt = 1) -> None:
         """Decrement the counter."""
-        self.set(self._counter - int(by))
+        self._counter = self._set(self._counter - int(by))
 
     @property
     def min_value(self) -> int | None:
@@ -93,6 +112,7 @@ class EventfulCounter(SupportsInt):
         if value is None:
             self._min_value = None
             self._min_ev.set_state(False)
+            self._set = self._build_set()
         else:
             if (
                 self._max_value is not None
@@ -107,6 +127,7 @@ class EventfulCounter(SupportsInt):
                 )
 
             self._min_value = value
+            self._set = self._build_set()
             self.set(self._counter)
 
     @property
@@ -119,6 +140,7 @@ class EventfulCounter(SupportsInt):
         if value is None:
             self._max_value = None
             self._max_ev.set_state(False)
+            self._set = self._build_set()
         else:
             if (
                 self._min_value is not None
@@ -133,27 +155,102 @@ class EventfulCounter(SupportsInt):
                 )
 
             self._max_value = value
+            self._set = self._build_set()
             self.set(self._counter)
 
     def set(self, value: int) -> None:
         """Set the counter to a specific value."""
-        self._counter = value
-
-        if self._max_value is not None and self._counter >= self._max_value:
-            self._max_ev.set()
-            if self._clamp_to_bounds:
-                self._counter = self._max_value
-
-        if self._min_ev.is_set() and self._counter > cast(int, self._min_value):
-            self._min_ev.clear()
+        self._counter = self._set(value)
+
+    @contextmanager
+    def batching(self) -> Iterator[None]:
+        """Defer bound checks until the end of the block.
+
+        Inside the block, the counter is updated without clamping it or updating its min/max
+        state. On exit, the final value is set as if by set(), so bounds are checked once for
+        the whole batch. Batches can be nested; bounds are checked when the outermost one exits.
+
+        Examples:
+            >>> counter = EventfulCounter(max_value=10, clamp_to_bounds=True)
+            >>> with counter.batching():
+            ...     for _ in range(20):
+            ...         counter += 1
+            ...     counter -= 5
+            >>> int(counter)
+            10
+        """
+        self._batch_depth += 1
+        self._set = self._build_set()
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self._set = self._build_set()
+            self._counter = self._set(self._counter)
+
+    def _build_set(self) -> Callable[[int], int]:
+        """Build the setter for the current bounds.
+
+        The setter takes the new value, updates the min/max state and returns the value to store,
+        clamped if needed. It only checks the bounds which are configured, so a counter without
+        bounds (or in the middle of a batch) stores the value as is. It must be rebuilt whenever
+        a bound changes. It only refers to the bounds and switches, not to the counter itself, so
+        it doesn't make the counter part of a reference cycle.
+        """
+        if self._batch_depth:
+            return _unchecked
+
+        min_value = self._min_value
+        max_value = self._max_value
+        clamp = self._clamp_to_bounds
+        min_ev = self._min_ev
+        max_ev = self._max_ev
+
+        if min_value is not None and max_value is not None:
+
+            def _set(value: int) -> int:
+                if value >= max_value:
+                    max_ev.set()
+                    if clamp:
+                        value = max_value
+
+                if value <= min_value:
+                    min_ev.set()
+                    if clamp:
+                        value = min_value
+                elif min_ev.is_set():
+                    min_ev.clear()
+
+                if value < max_value and max_ev.is_set():
+                    max_ev.clear()
+                return value
+
+        elif max_value is not None:
+
+            def _set(value: int) -> int:
+                if value >= max_value:
+                    max_ev.set()
+                    if clamp:
+                        value = max_value
+                else:
+                    max_ev.clear()
+                return value
+
+        elif min_value is not None:
+
+            def _set(value: int) -> int:
+                if value <= min_value:
+                    min_ev.set()
+                    if clamp:
+                        value = min_value
+                else:
+                    min_ev.clear()
+                return value
 
-        if self._min_value is not None and self._counter <= self._min_value:
-            self._min_ev.set()
-            if self._clamp_to_bounds:
-                self._counter = self._min_value
+        else:
+            return _unchecked
 
-        if self._max_ev.is_set() and self._counter < cast(int, self._max_value):
-            self._max_ev.clear()
+        return _set
 
     def __int__(self) -> int:
         return self._counter
@@ -222,7 +319,8 @@ class EventfulCounter(SupportsInt):
             f"(min: {self._min_value}, max: {self._max_value})>"
         )
 
-    __repr__ = __str__
+    def __repr__(self) -> str:
+        return self.__str__()
 
 
 __all__ = ("EventfulCounter",)
@@ -1,12 +1,18 @@
+from __future__ import annotations
+
 import asyncio
-import collections
+
+from ._shared_future import SharedFuture
 
 
 class Fuse:
     """Similar to asyncio.Event, but can only be set once."""
 
+    __slots__ = ("_future", "_value", "__weakref__")
+
     def __init__(self) -> None:
-        self._waiters: collections.deque[asyncio.Future[bool]] = collections.deque()
+        # Shared by every waiter; created on the first wait, as a Fuse can be made outside a loop
+        self._future: SharedFuture[bool] | None = None
         self._value = False
 
     def set(self) -> None:
@@ -14,9 +20,9 @@ class Fuse:
         if not self._value:
             self._value = True
 
-            for fut in self._waiters:
-                if not fut.done():
-                    fut.set_result(True)
+            fut = self._future
+            if fut is not None and not fut.done():
+                fut.set_result(True)
 
     def is_set(self) -> bool:
         """Return True if the fuse is set."""
@@ -24,15 +30,12 @@ class Fuse:
 
     async def wait(self) -> None:
         """Wait for the fuse to be set."""
-        if self._value:
-            return
-
-        fut = asyncio.get_event_loop().create_future()
-        self._waiters.append(fut)
-        try:
+        while not self._value:
+            fut = self._future
+            if fut is None or fut.done():
+                # A done future here was resolved with NoValue by a cancelled waiter
+                fut = self._future = SharedFuture(loop=asyncio.get_event_loop())
             await fut
-        finally:
-            self._waiters.remove(fut)
 
 
 __all__ = ("Fuse",)
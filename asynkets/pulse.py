@@ -2,18 +2,25 @@ from __future__ import annotations
 
 import time
 import asyncio
+import itertools
+import math
+import weakref
 from asyncio import Future
 from collections import deque
 from datetime import timedelta
 from functools import partial
-from typing import AsyncIterator, Callable, cast, Coroutine, Generator
+from heapq import heappop, heappush
+from typing import AsyncIterator, Callable, cast, ClassVar, Coroutine, Generator
 
 try:
     from typing import ParamSpec
 except ImportError:
-    from typing_extensions import ParamSpec
+    from typing_extensions import ParamSpec  # type: ignore[assignment]
 
+from ._sentinel import NoValue, NoValueT
+from ._shared_future import SharedFuture
 from .fuse import Fuse
+from .utils import _is_coroutine_function
 
 _P = ParamSpec("_P")
 
@@ -23,12 +30,29 @@ class PulseClosed(Exception):
 
 
 class _BasePulse:
+    __slots__ = (
+        "_waiters",
+        "_value",
+        "_loop",
+        "_current",
+        "_closed",
+        "_pulse_callbacks",
+        "_callback_tasks",
+        "__weakref__",
+    )
+
     def __init__(self) -> None:
         self._waiters: deque[Future[float]] = deque()
         self._value: float | None = None
-        self._loop = asyncio.get_event_loop()
-        self._closed = Fuse()
-        self._pulse_callbacks: list[Callable[[float], object] | Callable[[], object]] = []
+        self._loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        # Shared by the tasks awaiting the pulse; created on the first await of each cycle, so
+        # firing a pulse nobody awaits doesn't allocate one
+        self._current: SharedFuture[float] | None = None
+        self._closed: Fuse = Fuse()
+        self._pulse_callbacks: list[Callable[[], object]] = []
+        # Tasks running coroutine callbacks, kept until they finish; the event loop only holds
+        # weak references to tasks, so an untracked one may be collected before it completes
+        self._callback_tasks: set[asyncio.Task[object]] = set()
 
     def add_pulse_callback(
         self,
@@ -44,27 +68,34 @@ class _BasePulse:
         if thread_safe is True.
         """
 
-        if asyncio.iscoroutinefunction(callback):
+        if _is_coroutine_function(callback):
             _fn = cast(Callable[_P, Coroutine[object, object, object]], callback)
 
             def _cb() -> None:
-                _ = asyncio.create_task(_fn(*__args, **__kwargs))
-
-        elif thread_safe:
-
-            def _cb() -> None:
-                self._loop.call_soon_threadsafe(partial(callback, *__args, **__kwargs))
+                task = asyncio.create_task(_fn(*__args, **__kwargs))
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._callback_tasks.discard)
 
         else:
+            # Bind the arguments once here rather than on every fire
+            bound: Callable[[], object] = (
+                partial(callback, *__args, **__kwargs) if __args or __kwargs else callback
+            )
+
+            if not thread_safe:
+                # _run_callbacks already schedules each callback with call_soon
+                self._pulse_callbacks.append(bound)
+                return
 
             def _cb() -> None:
-                self._loop.call_soon(partial(callback, *__args, **__kwargs))
+                self._loop.call_soon_threadsafe(bound)
 
         self._pulse_callbacks.append(_cb)
 
     def _run_callbacks(self) -> None:
+        call_soon = self._loop.call_soon
         for cb in self._pulse_callbacks:
-            self._loop.call_soon(cb)
+            call_soon(cb)
 
     @property
     def is_closed(self) -> bool:
@@ -77,8 +108,15 @@ class _BasePulse:
         The resulting future will have a PulseClosed exception set as its exception.
         """
         self._closed.set()
-        for fut in self._waiters:
-            fut.set_exception(PulseClosed())
+        waiters, self._waiters = self._waiters, deque()
+        for fut in waiters:
+            if not fut.done():
+                fut.set_exception(PulseClosed())
+
+        # Shared waiters are woken with NoValue, and raise PulseClosed when they look again
+        current, self._current = self._current, None
+        if current is not None and not current.done():
+            current.set_result(NoValue)
 
     async def wait_closed(self) -> None:
         """Wait for the pulse to be closed."""
@@ -89,24 +127,49 @@ class _BasePulse:
 
         Returns a future that will be resolved when the pulse is fired.
         The future's result will be the time at which the pulse was fired, as per time.time().
+        Each call creates a new future which can be cancelled independently; prefer awaiting the
+        pulse itself when many tasks wait on it, as those share a single future.
         """
         fut = asyncio.get_event_loop().create_future()
         self._waiters.append(fut)
         return fut
 
+    def _cycle_future(self) -> SharedFuture[float]:
+        """Return the future resolved with the fire time at the end of the current cycle.
+
+        The future may instead be resolved with NoValue if the pulse is closed or a task waiting
+        on it is cancelled.
+        """
+        fut = self._current
+        if fut is None or fut.done():
+            # None if nobody awaited this cycle yet, and done if it was resolved with NoValue by a
+            # cancelled waiter. Made on the loop that's waiting, which needn't be the one that was
+            # current when the pulse was created
+            fut = self._current = SharedFuture(loop=asyncio.get_event_loop())
+        return fut
+
     def __await__(self) -> Generator[None, None, float]:
         """Wait for the pulse to be fired.
 
         Returns the time at which the pulse was fired, as given by time.time().
+
+        Unlike wait(), every task awaiting the pulse shares a single future per pulse cycle, so
+        firing the pulse resolves one future regardless of how many tasks are waiting.
         """
-        return self.wait().__await__()
+        while True:
+            if self._closed.is_set():
+                raise PulseClosed()
+
+            value = yield from self._cycle_future()
+            if not isinstance(value, NoValueT):
+                return value
 
     async def _aiter(self) -> AsyncIterator[float]:
-        while True:
-            try:
-                yield await self
-            except PulseClosed:
-                break
+        # Same as `yield await self` until closed, without the extra generator frame per pulse
+        while not self._closed.is_set():
+            value = await self._cycle_future()
+            if not isinstance(value, NoValueT):
+                yield value
 
     def __aiter__(self) -> AsyncIterator[float]:
         return self._aiter()
@@ -119,10 +182,17 @@ class _BasePulse:
         if self._closed.is_set():
             raise RuntimeError("Cannot fire a closed pulse")
 
-        self._value = time.time()
-        for fut in self._waiters:
-            fut.set_result(self._value)
-        self._waiters.clear()
+        value = self._value = time.time()
+
+        current, self._current = self._current, None
+        if current is not None and not current.done():
+            current.set_result(value)
+
+        # Swap in a fresh deque first, so waiters added while resolving wait for the next fire
+        waiters, self._waiters = self._waiters, deque()
+        for fut in waiters:
+            if not fut.done():
+                fut.set_result(value)
 
         self._run_callbacks()
 
@@ -168,9 +238,109 @@ class Pulse(_BasePulse):
         RuntimeError: Cannot fire a closed pulse
     """
 
+    __slots__ = ()
+
     fire = _BasePulse._fire
 
 
+class _TickScheduler:
+    """Runs the ticks of every PeriodicPulse on an event loop from a single loop timer.
+
+    Each loop.call_at pushes a TimerHandle onto the loop's heap, whose comparisons go through
+    TimerHandle.__lt__. The scheduler instead keeps the pulses' deadlines in its own heap of
+    (when, sequence, pulse) tuples, which compare as plain floats, and only keeps a timer on the
+    loop for the earliest of them.
+    """
+
+    __slots__ = ("_loop_ref", "_heap", "_sequence", "_handle", "_when", "__weakref__")
+
+    # The schedulers are only referenced weakly here, as each one (through its pulses) refers to
+    # its loop. Their armed timer on the loop and the pulses using them keep them alive.
+    _schedulers: ClassVar[
+        weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, weakref.ReferenceType[_TickScheduler]
+        ]
+    ] = weakref.WeakKeyDictionary()
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        # The loop holds the scheduler through its timer, so only refer back to it weakly
+        self._loop_ref = weakref.ref(loop)
+        self._heap: list[tuple[float, int, PeriodicPulse]] = []
+        self._sequence = itertools.count()
+        self._handle: asyncio.TimerHandle | None = None
+        self._when = math.inf
+
+    @classmethod
+    def for_loop(cls, loop: asyncio.AbstractEventLoop) -> _TickScheduler:
+        """Return the scheduler for the given loop, creating it if needed."""
+        try:
+            scheduler_ref = cls._schedulers.get(loop)
+        except TypeError:  # the loop can't be weakly referenced; don't share the scheduler
+            return cls(loop)
+
+        scheduler = scheduler_ref() if scheduler_ref is not None else None
+        if scheduler is None:
+            scheduler = cls(loop)
+            cls._schedulers[loop] = weakref.ref(scheduler)
+        return scheduler
+
+    def tick_at(self, when: float, pulse: PeriodicPulse) -> None:
+        """Schedule the pulse to tick at the given loop time."""
+        heappush(self._heap, (when, next(self._sequence), pulse))
+        if when < self._when:
+            self._schedule(when)
+
+    def _schedule(self, when: float) -> None:
+        loop = self._loop_ref()
+        if loop is None:
+            return
+
+        if self._handle is not None:
+            self._handle.cancel()
+        self._when = when
+        self._handle = loop.call_at(when, self._run_due)
+
+    def _run_due(self) -> None:
+        loop = self._loop_ref()
+        if loop is None:
+            return
+
+        # The loop runs timers slightly early (within its clock resolution), so everything
+        # scheduled up to this timer's deadline is due even if loop.time() hasn't reached it
+        deadline = max(self._when, loop.time())
+        self._handle = None
+        self._when = math.inf
+
+        heap = self._heap
+        due: list[tuple[float, int, PeriodicPulse]] = []
+        while heap and heap[0][0] <= deadline:
+            due.append(heappop(heap))
+
+        if heap:
+            self._schedule(heap[0][0])
+
+        pending = iter(due)
+        try:
+            for _, _, pulse in pending:
+                try:
+                    # Calling the method directly doesn't create a bound method for each tick
+                    pulse._tick()
+                except Exception as exc:
+                    loop.call_exception_handler(
+                        {
+                            "message": f"Exception in periodic pulse tick of {pulse!r}",
+                            "exception": exc,
+                        }
+                    )
+        finally:
+            # A BaseException from a tick (e.g. KeyboardInterrupt) stops the batch; put the ticks
+            # which didn't run back, so their pulses aren't dropped from the schedule
+            for entry in pending:
+                heappush(heap, entry)
+            if heap and heap[0][0] < self._when:
+                self._schedule(heap[0][0])
+
+
 class PeriodicPulse(_BasePulse):
     """A pulse that fires periodically.
 
@@ -201,6 +371,14 @@ class PeriodicPulse(_BasePulse):
         Pulse fired! 12:10:00
     """
 
+    __slots__ = (
+        "_period",
+        "_ticks",
+        "_tick_at",
+        "_next_time",
+        "_target_period",
+    )
+
     def __init__(
         self,
         period: float | timedelta,
@@ -215,22 +393,24 @@ class PeriodicPulse(_BasePulse):
                 pass 0.
         """
         super().__init__()
-        self._period = period.total_seconds() if isinstance(period, timedelta) else period
+        self._period: float = (
+            period.total_seconds() if isinstance(period, timedelta) else period
+        )
 
-        self._ticks = 0
+        self._ticks: int = 0
 
         if start_delay is None:
-            self._start_delay = self._period
+            start_delay = self._period
         elif isinstance(start_delay, timedelta):
-            self._start_delay = start_delay.total_seconds()
-        else:
-            self._start_delay = start_delay
+            start_delay = start_delay.total_seconds()
 
-        self._start_time = self._loop.time()
-        self._next_tick_handle = self._loop.call_at(
-            self._start_time + self._start_delay,
-            self._tick,
-        )
+        # Bound once, as _tick reschedules the pulse through it on every tick
+        self._tick_at = _TickScheduler.for_loop(self._loop).tick_at
+
+        # Each tick is scheduled a whole period after the previous one's scheduled time, rather
+        # than after the time it actually ran, so the pulse doesn't drift
+        self._next_time: float = self._loop.time() + start_delay
+        self._tick_at(self._next_time, self)
         self._target_period: float | None = None
 
     def _tick(self) -> None:
@@ -243,14 +423,11 @@ class PeriodicPulse(_BasePulse):
             self._period = self._target_period
             self._target_period = None
             self._ticks = 0
-            self._start_time = self._loop.time()
-            self._start_delay = 0
+            self._next_time = self._loop.time()
 
         self._ticks += 1
-        self._next_tick_handle = self._loop.call_at(
-            when=self._start_time + self._period * self._ticks + self._start_delay,
-            callback=self._tick,
-        )
+        self._next_time += self._period
+        self._tick_at(self._next_time, self)
 
     @property
     def period(self) -> timedelta:
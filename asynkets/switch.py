@@ -1,5 +1,9 @@
-from asyncio import Event
-from functools import partialmethod
+from __future__ import annotations
+
+import asyncio
+
+from ._sentinel import NoValue, NoValueT
+from ._shared_future import SharedFuture
 
 
 class Switch:
@@ -14,14 +18,17 @@ class Switch:
     wait_for() method can be used to wait for the switch to be in a specific state, and the
     wait_toggle(), wait_toggle_to(), wait_toggled_on(), and wait_toggled_off() methods can be
     used to wait for the switch to change from one state to another.
+
+    All waiters share a single future which is resolved with the new state on the next change, so
+    toggling the switch resolves one future regardless of how many tasks are waiting on it.
     """
 
+    __slots__ = ("_state", "_change", "__weakref__")
+
     def __init__(self, initial_state: bool = False) -> None:
         super().__init__()
-        self._ev_on = Event()
-        self._ev_off = Event()
         self._state: bool = initial_state
-        self.set_state(initial_state)
+        self._change: SharedFuture[bool] | None = None
 
     def set_state(self, state: bool) -> None:
         """Set the switch to a specific state.
@@ -39,15 +46,21 @@ class Switch:
 
         if not self._state:
             self._state = True
-            self._ev_on.set()
-            self._ev_off.clear()
+            change = self._change
+            if change is not None:
+                self._change = None
+                if not change.done():
+                    change.set_result(True)
 
     def clear(self) -> None:
         """Turn the switch off."""
         if self._state:
             self._state = False
-            self._ev_off.set()
-            self._ev_on.clear()
+            change = self._change
+            if change is not None:
+                self._change = None
+                if not change.done():
+                    change.set_result(False)
 
     def is_set(self) -> bool:
         """Return True if the switch is on."""
@@ -57,21 +70,34 @@ class Switch:
         """Return True if the switch is off."""
         return not self._state
 
+    def _next_change(self) -> SharedFuture[bool]:
+        """Return the future resolved with the new state on the next change of the switch.
+
+        The future may instead be resolved with NoValue if a task waiting on it is cancelled.
+        """
+        change = self._change
+        if change is None or change.done():
+            change = self._change = SharedFuture(loop=asyncio.get_event_loop())
+        return change
+
     async def wait(self) -> None:
         """Wait until the switch is in the "on" state.
 
         Returns immediately if the switch is already in the "on" state.
         """
-        if not self._state:
-            await self._ev_on.wait()
+        while not self._state:
+            # Return on the change itself, as the switch may be cleared again before we run
+            if await self._next_change() is True:
+                return
 
     async def wait_clear(self) -> None:
         """Wait until the switch is in the "off" state.
 
         Returns immediately if the switch is already in the "off" state.
         """
-        if self._state:
-            await self._ev_off.wait()
+        while self._state:
+            if await self._next_change() is False:
+                return
 
     async def wait_for(self, state: bool) -> None:
         """Wait until the switch is in a specific state. Returns immediately if it already is.
@@ -86,10 +112,9 @@ class Switch:
 
     async def wait_toggle(self) -> None:
         """Wait for the switch to change from False to True, or True to False."""
-        if self._state:
-            await self.wait_clear()
-        else:
-            await self.wait()
+        change: bool | NoValueT = NoValue
+        while change is NoValue:
+            change = await self._next_change()
 
     async def wait_toggle_to(self, state: bool) -> None:
         """Wait for the switch to change from one state to another.
@@ -100,15 +125,17 @@ class Switch:
         Args:
             state: The state to wait for.
         """
-        if state:
-            await self.wait_clear()
-            await self.wait()
-        else:
-            await self.wait()
-            await self.wait_clear()
+        change: bool | NoValueT = NoValue
+        while change != state:
+            change = await self._next_change()
+
+    async def wait_toggled_on(self) -> None:
+        """Wait for the switch to change from "off" to "on"."""
+        await self.wait_toggle_to(True)
 
-    wait_toggled_on = partialmethod(wait_toggle_to, True)
-    wait_toggled_off = partialmethod(wait_toggle_to, False)
+    async def wait_toggled_off(self) -> None:
+        """Wait for the switch to change from "on" to "off"."""
+        await self.wait_toggle_to(False)
 
 
 __all__ = ("Switch",)
@@ -22,6 +22,7 @@ from typing import (
 )
 
 from .switch import Switch
+from .utils import _is_coroutine_function
 
 _T = TypeVar("_T")
 
@@ -63,6 +64,8 @@ class TimedDeque(Generic[_T], deque[_T]):
         self._period = period.total_seconds() if isinstance(period, timedelta) else period
         self._callbacks: list[_SyncFn[_T] | _AsyncFn[_T]] = callbacks or []
         self._pending_futs: dict[int, asyncio.Future[_T]] = {}
+        # Coroutine callbacks for removed items, held until they're done (see _resolve)
+        self._callback_tasks: set[asyncio.Task[None]] = set()
 
         self._empty = Switch(initial_state=len(self) == 0)
 
@@ -78,8 +81,10 @@ class TimedDeque(Generic[_T], deque[_T]):
         """Called when an item is removed. Schedules callbacks and pops the item's future."""
         item = fut.result()
         for callback in self._callbacks:
-            if asyncio.iscoroutinefunction(callback):
-                self._loop.create_task(callback(item))
+            if _is_coroutine_function(callback):
+                task = self._loop.create_task(callback(item))
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._callback_tasks.discard)
             else:
                 self._loop.call_soon(callback, item)
 
@@ -6,11 +6,11 @@ import time
 from collections.abc import AsyncIterator, Iterable, AsyncIterable
 
 try:
-    from typing import ParamSpec
+    from typing import ParamSpec, TypeGuard
 except ImportError:
-    from typing_extensions import ParamSpec
+    from typing_extensions import ParamSpec, TypeGuard
 
-from typing import Callable, cast, Coroutine, TYPE_CHECKING, TypeVar
+from typing import Any, Callable, cast, Coroutine, TYPE_CHECKING, TypeVar
 
 _T = TypeVar("_T")
 _T_co = TypeVar("_T_co", covariant=True)
@@ -22,6 +22,26 @@ _A = TypeVar("_A")
 _B = TypeVar("_B")
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_iscoroutinefunction(fn: Callable[..., object]) -> bool:
+    return asyncio.iscoroutinefunction(fn)
+
+
+def _is_coroutine_function(
+    fn: Callable[..., object]
+) -> TypeGuard[Callable[..., Coroutine[Any, Any, Any]]]:
+    """Return whether fn is a coroutine function, caching the result per function.
+
+    Bound methods are looked up by their underlying function, so the cache doesn't keep their
+    instances alive. Other callables, such as closures and partials, are held by the cache until
+    they are evicted from it.
+    """
+    try:
+        return _cached_iscoroutinefunction(getattr(fn, "__func__", fn))
+    except TypeError:  # unhashable callable
+        return asyncio.iscoroutinefunction(fn)
+
+
 def ensure_coroutine_function(
     fn: Callable[_P, _T_co] | Callable[_P, Coroutine[_A, _B, _T_co]],
     to_thread: bool = False,
@@ -36,22 +56,28 @@ def ensure_coroutine_function(
         An async function that runs the original function.
     """
 
-    if asyncio.iscoroutinefunction(fn):
-        return fn
+    if _is_coroutine_function(fn):
+        return cast(Callable[_P, Coroutine[_A, _B, _T_co]], fn)
 
     _fn_sync = cast(Callable[_P, _T_co], fn)
     if to_thread:
 
-        @functools.wraps(_fn_sync)
         async def _async_fn(*__args: _P.args, **__kwargs: _P.kwargs) -> _T_co:
             return await asyncio.to_thread(_fn_sync, *__args, **__kwargs)
 
     else:
 
-        @functools.wraps(_fn_sync)
         async def _async_fn(*__args: _P.args, **__kwargs: _P.kwargs) -> _T_co:
             return _fn_sync(*__args, **__kwargs)
 
+    # Copy the identifying metadata by hand; functools.wraps also copies __annotations__ and
+    # merges __dict__, which is most of its cost and isn't needed for a thin wrapper
+    _async_fn.__module__ = getattr(_fn_sync, "__module__", _async_fn.__module__)
+    _async_fn.__name__ = getattr(_fn_sync, "__name__", _async_fn.__name__)
+    _async_fn.__qualname__ = getattr(_fn_sync, "__qualname__", _async_fn.__qualname__)
+    _async_fn.__doc__ = getattr(_fn_sync, "__doc__", None)
+    _async_fn.__wrapped__ = _fn_sync  # type: ignore[attr-defined]
+
     return _async_fn
 
 
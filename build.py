@@ -0,0 +1,50 @@
+"""Optional mypyc build for asynkets.
+
+The package is normally built by poetry as a pure Python wheel. This script instead builds a
+wheel for the current interpreter and platform, with the modules below compiled into C extensions
+by mypyc. Run it from a source checkout, with mypy, setuptools and wheel installed:
+
+    pip install mypy setuptools wheel
+    python build.py bdist_wheel
+    pip install dist/asynkets-*.whl
+
+pulse.py is left interpreted, as mypyc does not support async generators, and _shared_future.py
+because mypyc cannot subclass asyncio.Future. Native classes don't support weak references, so
+the __weakref__ slot of the compiled classes has no effect.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+MYPYC_MODULES = [
+    "asynkets/_sentinel.py",
+    "asynkets/eventful_counter.py",
+    "asynkets/fuse.py",
+    "asynkets/switch.py",
+]
+
+
+def _version() -> str:
+    """Return the package version from pyproject.toml, so it's only kept in one place."""
+    pyproject = (Path(__file__).parent / "pyproject.toml").read_text()
+    match = re.search(r'^version = "([^"]+)"', pyproject, re.MULTILINE)
+    if match is None:
+        raise RuntimeError("No version found in pyproject.toml")
+    return match.group(1)
+
+
+if __name__ == "__main__":
+    from mypyc.build import mypycify
+    from setuptools import setup
+
+    setup(
+        name="asynkets",
+        version=_version(),
+        packages=["asynkets"],
+        python_requires=">=3.8",
+        # Modules left interpreted are still type checked by mypyc; silence their errors
+        ext_modules=mypycify(["--follow-imports=silent", *MYPYC_MODULES], opt_level="3"),
+        zip_safe=False,
+    )
@@ -0,0 +1,28 @@
+import os
+
+import pytest
+from hypothesis import Phase, settings
+from hypothesis.database import InMemoryExampleDatabase
+from timeless_loop import TimelessEventLoop
+
+# The default profile is deterministic, which also means it keeps no example database, and it
+# doesn't shrink or target. Run with HYPOTHESIS_PROFILE=nightly to explore fresh examples and
+# minimize failures; those are kept in memory rather than in the .hypothesis directory, which
+# xdist workers would otherwise all be writing to.
+settings.register_profile(
+    "ci",
+    derandomize=True,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+)
+settings.register_profile("nightly", database=InMemoryExampleDatabase(), phases=list(Phase))
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "ci"))
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    # One loop for the whole session (per xdist worker), rather than a new one for each test.
+    # It runs on virtual time, so periodic pulses tick as soon as nothing else is ready to run
+    # instead of waiting on the wall clock
+    loop = TimelessEventLoop(raise_on_deadlock=True)
+    yield loop
+    loop.close()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import itertools
 from typing import Literal
 
@@ -93,3 +94,32 @@ async def test_set(
         assert counter.max_is_set() == (int(counter) >= int(max_val))
     else:
         assert counter.max_is_set() is False
+
+
+@pytest.mark.parametrize("clamp", [True, False])
+def test_batching(clamp: bool) -> None:
+    counter = EventfulCounter(min_value=0, max_value=10, clamp_to_bounds=clamp)
+    assert counter.min_is_set()
+
+    with counter.batching():
+        for _ in range(15):
+            counter += 1
+        with counter.batching():
+            counter -= 3
+        assert int(counter) == 12
+        assert counter.min_is_set()
+        assert not counter.max_is_set()
+
+    assert int(counter) == (10 if clamp else 12)
+    assert not counter.min_is_set()
+    assert counter.max_is_set()
+
+
+@pytest.mark.asyncio
+async def test_wait_max_wakes_on_max_reached_then_left(counter: EventfulCounter) -> None:
+    waiter = asyncio.create_task(counter.wait_max())
+    await asyncio.sleep(0)
+
+    counter.set(10)
+    counter.set(5)
+    await asyncio.wait_for(waiter, timeout=1.0)
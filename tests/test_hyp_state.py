@@ -1,8 +1,8 @@
 import asyncio 
 import pytest
 
-from hypothesis import given, strategies as st
-from hypothesis.stateful import invariant, precondition, rule, RuleBasedStateMachine
+from hypothesis import settings, strategies as st
+from hypothesis.stateful import initialize, invariant, rule, RuleBasedStateMachine
 from hypothesis.strategies import DrawFn
 from asynkets import EventfulCounter
 
@@ -11,18 +11,24 @@ from timeless_loop import TimelessEventLoopPolicy
 asyncio.set_event_loop_policy(TimelessEventLoopPolicy(raise_on_deadlock=True))
 
 
+_integers = st.integers()
+_booleans = st.booleans()
+_optional_integers = st.one_of(st.none(), _integers)
+# Values for the rules, shared by all of them; bounded so that shrinking doesn't spend its time
+# on huge integers
+_rule_values = st.integers(min_value=-(1 << 20), max_value=1 << 20)
+
+
 @st.composite
 def eventful_counters(draw: DrawFn) -> EventfulCounter:
 
-    initial_value = draw(st.integers())
-    clamp_to_bounds = draw(st.booleans())
+    initial_value = draw(_integers)
+    clamp_to_bounds = draw(_booleans)
 
-    min_value = draw(
-        st.one_of(
-            st.none(),
-            st.integers(max_value=initial_value if clamp_to_bounds else None),
-        )
-    )
+    if clamp_to_bounds:
+        min_value = draw(st.one_of(st.none(), st.integers(max_value=initial_value)))
+    else:
+        min_value = draw(_optional_integers)
 
     if clamp_to_bounds:
         vals = [v for v in (min_value, initial_value) if v is not None]
@@ -32,14 +38,10 @@ def eventful_counters(draw: DrawFn) -> EventfulCounter:
     else:
         max_min = min_value + 1 if min_value is not None else None
 
-    max_value = draw(
-        st.one_of(
-            st.none(),
-            st.integers(
-                min_value=max_min,
-            ),
-        )
-    )
+    if max_min is None:
+        max_value = draw(_optional_integers)
+    else:
+        max_value = draw(st.one_of(st.none(), st.integers(min_value=max_min)))
 
     return EventfulCounter(
         initial_value=initial_value,
@@ -50,35 +52,36 @@ def eventful_counters(draw: DrawFn) -> EventfulCounter:
 
 
 class EventfulCounterStateMachine(RuleBasedStateMachine):
-    @given(eventful_counters())
-    def __init__(self, counter: EventfulCounter) -> None:
-        super().__init__()
+    counter: EventfulCounter
+
+    @initialize(counter=eventful_counters())
+    def init_counter(self, counter: EventfulCounter) -> None:
         self.counter = counter
 
     # def teardown(self) -> None:
     #     del self.counter
 
-    @rule(value=st.integers())
+    @rule(value=_rule_values)
     def set(self, value):
         self.counter.set(value)
 
-    @rule(value=st.integers())
+    @rule(value=_rule_values)
     def inc(self, value):
         self.counter.inc(value)
 
-    @rule(value=st.integers())
+    @rule(value=_rule_values)
     def dec(self, value):
         self.counter.dec(value)
 
-    @rule(value=st.integers())
+    @rule(value=_rule_values)
     def iadd(self, value):
         self.counter += value
 
-    @rule(value=st.integers())
+    @rule(value=_rule_values)
     def isub(self, value):
         self.counter -= value
 
-    @rule(value=st.integers())
+    @rule(value=_rule_values)
     def set_max_value(self, value: int):
         if value < self.counter._counter and self.counter._clamp_to_bounds:
             with pytest.raises(ValueError):
@@ -86,7 +89,7 @@ class EventfulCounterStateMachine(RuleBasedStateMachine):
         else:
             self.counter.max_value = value
 
-    @rule(value=st.integers())
+    @rule(value=_rule_values)
     def set_min_value(self, value: int):
         if value > self.counter._counter and self.counter._clamp_to_bounds:
             with pytest.raises(ValueError):
@@ -94,44 +97,29 @@ class EventfulCounterStateMachine(RuleBasedStateMachine):
         else:
             self.counter.min_value = value
 
-    @precondition(lambda self: self.counter._clamp_to_bounds)
     @invariant()
-    def verify_value_in_bounds(self):
-        if self.counter._min_value is not None:
-            assert self.counter._counter >= self.counter._min_value
+    def check_counter(self):
+        # A single invariant, as Hypothesis calls each one (and its precondition) after every step
+        counter = self.counter
+        assert int(counter) == counter._counter
+        assert counter.min_value == counter._min_value
+        assert counter.max_value == counter._max_value
 
-        if self.counter._max_value is not None:
-            assert self.counter._counter <= self.counter._max_value
+        if not counter._clamp_to_bounds:
+            return
 
-    @precondition(lambda self: self.counter._clamp_to_bounds)
-    @invariant()
-    def verify_min_bounds(self):
-        if self.counter._min_value is not None:
-            if self.counter._counter <= self.counter._min_value:
-                assert self.counter._min_ev.is_set()
-                return
-        assert not self.counter._min_ev.is_set()
-
-    @precondition(lambda self: self.counter._clamp_to_bounds)
-    @invariant()
-    def verify_max_bounds(self):
-        if self.counter._max_value is not None:
-            if self.counter._counter >= self.counter._max_value:
-                assert self.counter._max_ev.is_set()
-                return
-        assert not self.counter._max_ev.is_set()
+        min_reached = counter._min_value is not None and counter._counter <= counter._min_value
+        max_reached = counter._max_value is not None and counter._counter >= counter._max_value
 
-    @invariant()
-    def test_min_value(self):
-        assert self.counter.min_value == self.counter._min_value
+        if counter._min_value is not None:
+            assert counter._counter >= counter._min_value
+        if counter._max_value is not None:
+            assert counter._counter <= counter._max_value
 
-    @invariant()
-    def test_max_value(self):
-        assert self.counter.max_value == self.counter._max_value
-
-    @invariant()
-    def check_counter_int(self):
-        assert int(self.counter) == self.counter._counter
+        assert counter._min_ev.is_set() == min_reached
+        assert counter._max_ev.is_set() == max_reached
 
 
 TestEventfulCounter = EventfulCounterStateMachine.TestCase
+# Rules are cheap and the invariants are simple bound checks, so fewer and shorter runs suffice
+TestEventfulCounter.settings = settings(max_examples=50, stateful_step_count=20, deadline=None)
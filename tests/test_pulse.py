@@ -1,30 +1,180 @@
 import asyncio
+import gc
+import weakref
 from datetime import timedelta
 
 import pytest
+from timeless_loop import TimelessEventLoop
 
-from asynkets import PeriodicPulse
+from asynkets import PeriodicPulse, Pulse
+from asynkets.pulse import _TickScheduler
 
 
 @pytest.mark.asyncio
 async def test_periodic_pulse_with_timedelta_period():
     periodic_pulse = PeriodicPulse(timedelta(seconds=1))
     assert periodic_pulse.period == timedelta(seconds=1)
+    periodic_pulse.close()
 
 
 @pytest.mark.asyncio
 async def test_periodic_pulse_with_count():
     periodic_pulse = PeriodicPulse(timedelta(seconds=0.1))
 
-    async def iter_counter():
+    async def iter_counter(n):
         count = 0
         async for _ in periodic_pulse:
             count += 1
+            if count == n:
+                periodic_pulse.close()
         return count
 
-    counter = asyncio.create_task(iter_counter())
     assert periodic_pulse.period == timedelta(seconds=0.1)
+    assert await asyncio.wait_for(iter_counter(3), timeout=1.0) == 3
 
-    await asyncio.sleep(0.35)
-    periodic_pulse.close()
-    assert await counter == 3
+
+@pytest.mark.asyncio
+async def test_pulse_cancelled_waiter_does_not_cancel_others():
+    pulse = Pulse()
+
+    async def wait_once():
+        return await pulse
+
+    cancelled = asyncio.create_task(wait_once())
+    waiters = [asyncio.create_task(wait_once()) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert cancelled.cancelled()
+    assert not any(waiter.done() for waiter in waiters)
+
+    pulse.fire()
+    assert await asyncio.gather(*waiters) == [pulse._value] * 3
+
+
+@pytest.mark.asyncio
+async def test_pulse_fire_skips_cancelled_wait_futures():
+    pulse = Pulse()
+    cancelled = pulse.wait()
+    waiting = pulse.wait()
+    cancelled.cancel()
+
+    pulse.fire()
+    assert await waiting == pulse._value
+
+
+def test_pulse_created_outside_the_loop():
+    pulse = Pulse()
+    loop = TimelessEventLoop(raise_on_deadlock=True)
+
+    async def main():
+        asyncio.get_running_loop().call_soon(pulse.fire)
+        first = await pulse
+        asyncio.get_running_loop().call_soon(pulse.fire)
+        async for value in pulse:
+            return first, value
+
+    try:
+        first, second = loop.run_until_complete(main())
+    finally:
+        loop.close()
+    assert isinstance(first, float)
+    assert second == pulse._value
+
+
+@pytest.mark.asyncio
+async def test_pulse_fire_without_waiters_allocates_no_future():
+    pulse = Pulse()
+    pulse.fire()
+    assert pulse._current is None
+
+    async def wait_once():
+        return await pulse
+
+    waiter = asyncio.create_task(wait_once())
+    await asyncio.sleep(0)
+    assert pulse._current is not None
+
+    pulse.fire()
+    assert await waiter == pulse._value
+    assert pulse._current is None
+
+
+def test_periodic_pulses_share_one_loop_timer():
+    # On a loop of its own, as the session loop holds timers and ticks from earlier tests
+    loop = TimelessEventLoop(raise_on_deadlock=True)
+
+    async def iter_counter(pulse):
+        count = 0
+        async for _ in pulse:
+            count += 1
+        return count
+
+    async def main():
+        pulses = [PeriodicPulse(period) for period in (0.02, 0.04, 0.06)]
+        scheduler = _TickScheduler.for_loop(loop)
+        assert len(scheduler._heap) == 3
+        assert scheduler._handle is not None
+        assert loop._scheduled == [scheduler._handle]
+
+        counters = [asyncio.create_task(iter_counter(pulse)) for pulse in pulses]
+        await asyncio.sleep(0.13)
+        for pulse in pulses:
+            pulse.close()
+        return await asyncio.gather(*counters)
+
+    try:
+        assert loop.run_until_complete(main()) == [6, 3, 2]
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("close", [True, False])
+def test_periodic_pulse_does_not_keep_its_loop_alive(close):
+    loop = asyncio.new_event_loop()
+    loop_ref = weakref.ref(loop)
+
+    async def main():
+        pulse = PeriodicPulse(3600)
+        if close:
+            pulse.close()
+
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+    del loop
+    gc.collect()
+    assert loop_ref() is None
+
+
+class _Interrupt(BaseException):
+    pass
+
+
+class _FakePulse:
+    def __init__(self, tick):
+        self._tick = tick
+
+
+@pytest.mark.asyncio
+async def test_tick_scheduler_keeps_unrun_ticks_on_base_exception():
+    loop = asyncio.get_running_loop()
+    scheduler = _TickScheduler(loop)
+    ran = []
+
+    def interrupt():
+        raise _Interrupt()
+
+    now = loop.time()
+    scheduler.tick_at(now, _FakePulse(interrupt))
+    scheduler.tick_at(now, _FakePulse(lambda: ran.append(1)))
+
+    with pytest.raises(_Interrupt):
+        scheduler._run_due()
+    assert ran == []
+
+    scheduler._run_due()
+    assert ran == [1]
+    assert scheduler._handle is None
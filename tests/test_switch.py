@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+from asynkets import Switch
+
+
+@pytest.mark.asyncio
+async def test_wait_wakes_on_set_then_clear():
+    switch = Switch()
+    waiter = asyncio.create_task(switch.wait())
+    await asyncio.sleep(0)
+
+    # The waiter only runs after the switch is off again, but it must still see it was turned on
+    switch.set()
+    switch.clear()
+    await asyncio.wait_for(waiter, timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_wait_clear_wakes_on_clear_then_set():
+    switch = Switch(initial_state=True)
+    waiter = asyncio.create_task(switch.wait_clear())
+    await asyncio.sleep(0)
+
+    switch.clear()
+    switch.set()
+    await asyncio.wait_for(waiter, timeout=1.0)